@@ -7,14 +7,24 @@
 
 import sys
 import os
+import dis
 import modulefinder
+import multiprocessing
+import multiprocessing.pool
+import functools
+import itertools
+import hashlib
+import pickle
+import stat
 import tempfile
 import glob
 import shutil
 
 # Original modules
+from . import __version__
 from . import detect
 from . import constants
+from . import datatypes
 from . import exceptions
 from . import process
 
@@ -38,6 +48,10 @@ class ModuleCompiler(object):
     .. versionchanged:: 0.10.0
        The argument ``pyc_path`` was added.
 
+    .. versionchanged:: 1.0.0
+       :attr:`compilable_modules` is now an instance of
+       :class:`ironpycompiler.datatypes.PathSet` instead of :class:`set`.
+
     """
 
     def __init__(self, paths_to_scripts, ipy_dir=None, pyc_path=None):
@@ -54,23 +68,27 @@ class ModuleCompiler(object):
         else:
             self.pyc_abspath = os.path.abspath(pyc_path)
 
-        self.paths_to_scripts = [os.path.abspath(x) for x in
-                                 paths_to_scripts]  # コンパイルすべきスクリプトたち
+        cwd = os.getcwd()
+        self.paths_to_scripts = [os.path.normpath(os.path.join(cwd, x)) for x
+                                 in paths_to_scripts]  # コンパイルすべきスクリプトたち
         self.dirs_of_modules = None  # 依存モジュールたちのディレクトリ
         #: Set of the names of built-in modules.
         self.builtin_modules = set()
-        #: Set of the paths to required and compilable modules.
-        self.compilable_modules = set()
+        #: Set of the paths to required and compilable modules, as an
+        #: instance of :class:`ironpycompiler.datatypes.PathSet`.
+        self.compilable_modules = datatypes.PathSet()
         #: Set of the names of required but uncompilable modules.
         self.uncompilable_modules = set()
-        self.response_file = None  # pyc.pyに渡すレスポンスファイル
+        self.response_file = None  # pyc.pyに渡すレスポンスファイルのパス
         #: Output from pyc.py (stdout and stderr).
         self.pyc_stdout = None
         self.pyc_stderr = None  # pyc.pyから得た標準エラー出力、不要
         #: The path to the main output assembly.
         self.output_asm = None
+        self._analyzed = False  # check_compilabilityが実行されたか
 
-    def check_compilability(self, dirs_of_modules=None):
+    def check_compilability(self, dirs_of_modules=None, use_cache=True,
+                            share_modulefinder=True):
         """Check the compilability of the modules required by the scripts.
 
         This method analyzes the scripts with
@@ -78,6 +96,19 @@ class ModuleCompiler(object):
         :attr:`builtin_modules`, :attr:`compilable_modules`, and
         :attr:`uncompilable_modules`.
 
+        By default all the scripts are analyzed with one
+        :class:`modulefinder.ModuleFinder`, so that the modules shared by
+        them are parsed only once. If ``share_modulefinder`` is false,
+        each script is analyzed separately, and in parallel using
+        :class:`multiprocessing.Pool` if more than one script is given.
+        On Windows this raises :exc:`RuntimeError` unless the script
+        calling this method protects its main code with
+        ``if __name__ == "__main__":``.
+
+        The results are cached in the temporary directory, and reused as
+        long as none of the scripts, the modules found, and the
+        directories searched have been modified.
+
         :param list dirs_of_modules: Specify the paths of the
                                      directories where the modules your
                                      scripts require exist, or this
@@ -85,6 +116,54 @@ class ModuleCompiler(object):
                                      modules in the IronPython standard
                                      library, and the CPython site-packages
                                      directory.
+        :param bool use_cache: (optional) Specify whether to use the
+                               cached results of the previous analysis.
+        :param bool share_modulefinder: (optional) Specify whether to
+                                        analyze all the scripts with one
+                                        :class:`modulefinder.ModuleFinder`.
+                                        Set this to false if the scripts
+                                        require different modules that
+                                        have the same name.
+
+        .. versionchanged:: 1.0.0
+           The parameters ``use_cache`` and ``share_modulefinder`` were
+           added.
+
+        """
+
+        self._set_dirs_of_modules(dirs_of_modules)
+
+        # 前回の解析結果が使えるならそれを使う
+        cache_path = _cache_path(self.ipy_dir, self.paths_to_scripts,
+                                 self.dirs_of_modules, share_modulefinder)
+        results = _load_cache(cache_path) if use_cache else None
+
+        if results is None:
+            # 各スクリプトが依存するモジュールを探索する
+            # ModuleFinderを共有しないなら別々のプロセスで並列に解析する
+            if share_modulefinder or len(self.paths_to_scripts) == 1:
+                found = [_analyze_all(self.paths_to_scripts,
+                                      self.dirs_of_modules)]
+            else:
+                found = _analyze_each(self.paths_to_scripts,
+                                      self.dirs_of_modules)
+            results = _merge_results(found)
+
+            if use_cache:
+                # パッケージにモジュールが追加されたことも検出するため、
+                # 各モジュールのディレクトリも監視する
+                watched = (list(self.paths_to_scripts) + list(results[1]) +
+                           list(self.dirs_of_modules) +
+                           list(set(os.path.dirname(p) for p in results[1])))
+                _save_cache(cache_path, watched, results)
+
+        self.builtin_modules |= results[0]
+        self.compilable_modules |= results[1]
+        self.uncompilable_modules |= results[2]
+        self._analyzed = True
+
+    def _set_dirs_of_modules(self, dirs_of_modules):
+        """Set :attr:`dirs_of_modules`, or the default directories if None.
 
         """
 
@@ -92,29 +171,14 @@ class ModuleCompiler(object):
         if self.dirs_of_modules is None:
             self.dirs_of_modules = [os.path.join(self.ipy_dir,
                                                  "Lib")]
-            self.dirs_of_modules += [p for p in sys.path if
-                                     "site-packages" in p]
-
-        # 各スクリプトが依存するモジュールを探索する
-        for script in self.paths_to_scripts:
-            mf = modulefinder.ModuleFinder(path=self.dirs_of_modules)
-            mf.run_script(script)
-            self.uncompilable_modules |= set(mf.badmodules.keys())
-            for name, module in mf.modules.iteritems():
-                path_to_module = module.__file__
-                if path_to_module is None:
-                    self.builtin_modules.add(name)
-                    continue
-                elif os.path.splitext(path_to_module)[1] == ".pyd":
-                    self.uncompilable_modules.add(name)
-                    continue
-                else:
-                    self.compilable_modules.add(
-                        os.path.abspath(path_to_module))
-        self.compilable_modules -= set(self.paths_to_scripts)
+            # 存在しないディレクトリや重複を除く
+            for p in sys.path:
+                if ("site-packages" in p and p not in self.dirs_of_modules
+                        and os.path.isdir(p)):
+                    self.dirs_of_modules.append(p)
 
     def call_pyc(self, args, delete_resp=True,
-                 executable=constants.EXECUTABLE, cwd=None):
+                 executable=constants.EXECUTABLE, cwd=None, stream=None):
         """Call pyc.py in order to compile your scripts.
 
         In general use this method is not supposed to be called
@@ -128,36 +192,37 @@ class ModuleCompiler(object):
         :param str executable: (optional) Specify the name of the
                                Ironpython exectuable.
         :param str cwd: (optional) Specify the current working directory.
+        :param stream: (optional) Specify a file-like object to which the
+                       output from pyc.py should be written while it is
+                       running.
 
         .. versionchanged:: 1.0.0
            Now uses :func:`ironpycompiler.process.execute_ipy`.
+           ``response_file`` is now the path to the response file. The
+           parameter ``stream`` was added.
 
         """
 
         if cwd is None:
             cwd = os.getcwd()
 
-        # レスポンスファイルを作る
-        self.response_file = tempfile.mkstemp(suffix=".txt",
-                                              text=True, prefix="IPC")
-
-        # レスポンスファイルに書き込む
-        for line in args:
-            os.write(self.response_file[0], line + "\n")
-
-        # レスポンスファイルを閉じる
-        os.close(self.response_file[0])
+        # レスポンスファイルを作り、バッファ経由で書き込む
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt",
+                                         prefix="IPC", delete=False) as f:
+            self.response_file = f.name
+            f.writelines(line + "\n" for line in args)
 
         # pyc.pyを実行する
-        ipy_args = [self.pyc_abspath, "@" + self.response_file[1]]
+        ipy_args = [self.pyc_abspath, "@" + self.response_file]
         ipy_exe = os.path.abspath(os.path.join(self.ipy_dir, executable))
         ipy_result = process.execute_ipy(arguments=ipy_args,
-                                         path_to_exe=ipy_exe, cwd=cwd)
+                                         path_to_exe=ipy_exe, cwd=cwd,
+                                         stream=stream)
         self.pyc_stdout = ipy_result[0]
 
         # レスポンスファイルを削除する
         if delete_resp:
-            os.remove(self.response_file[1])
+            os.remove(self.response_file)
 
         # ipyのエラーを確認する
         if ipy_result[1] != 0:
@@ -167,12 +232,13 @@ class ModuleCompiler(object):
 
     def create_asm(self, out=None, target_asm="dll", target_platform=None,
                    embed=True, standalone=True, mta=False, delete_resp=True,
-                   executable=constants.EXECUTABLE, copy_ipydll=False):
+                   executable=constants.EXECUTABLE, copy_ipydll=False,
+                   stream=None):
         """Compile your scripts into a .NET assembly, using pyc.py.
 
         This method compiles the scripts by calling pyc.py. If
-        :attr:`compilable_modules` is empty, the scripts will be
-        analyzed using :meth:`check_compilability`. For the detail of
+        :meth:`check_compilability` has not been called yet, the scripts
+        will be analyzed using it. For the detail of
         compilation see the source code of pyc.py.
 
         :param str out: (optional) Specify the name of the EXE file
@@ -199,10 +265,17 @@ class ModuleCompiler(object):
         :param bool copy_ipydll: (optional) Specify whether to copy the
                                  IronPython DLL files into the
                                  destination directory.
+        :param stream: (optional) Specify a file-like object to which the
+                       output from pyc.py should be written while it is
+                       running.
+
+        .. versionchanged:: 1.0.0
+           The parameter ``stream`` was added. The scripts are no longer
+           analyzed again if they require no compilable modules.
 
         """
 
-        if self.compilable_modules == set():
+        if not self._analyzed:
             self.check_compilability()
 
         if out is None:
@@ -216,25 +289,26 @@ class ModuleCompiler(object):
         else:
             self.output_asm = os.path.abspath(out)
 
-        pyc_args = ["/out:" + os.path.splitext(self.output_asm)[0]]
+        flags = ["/out:" + os.path.splitext(self.output_asm)[0]]
 
         if target_asm in ["exe", "winexe"]:
-            pyc_args.append("/target:" + target_asm)
-            pyc_args.append("/main:" + self.paths_to_scripts[0])
+            flags.append("/target:" + target_asm)
+            flags.append("/main:" + self.paths_to_scripts[0])
             if target_platform in ["x86", "x64"]:
-                pyc_args.append("/platform:" + target_platform)
+                flags.append("/platform:" + target_platform)
             if embed:
-                pyc_args.append("/embed")
+                flags.append("/embed")
             if standalone:
-                pyc_args.append("/standalone")
+                flags.append("/standalone")
         if target_asm == "winexe" and mta:
-            pyc_args.append("/mta")
-        pyc_args += self.paths_to_scripts
-        pyc_args += self.compilable_modules
+            flags.append("/mta")
+        pyc_args = list(itertools.chain(flags, self.paths_to_scripts,
+                                        self.compilable_modules))
 
         call_args = {"args": pyc_args, "delete_resp": delete_resp,
                      "executable": executable,
-                     "cwd": os.path.dirname(self.output_asm)}
+                     "cwd": os.path.dirname(self.output_asm),
+                     "stream": stream}
 
         self.call_pyc(**call_args)
 
@@ -242,6 +316,459 @@ class ModuleCompiler(object):
             gather_ipydll(dest_dir=os.path.dirname(self.output_asm),
                           ipy_dir=self.ipy_dir)
 
+    def create_asms(self, out_dir=None, dirs_of_modules=None,
+                    copy_ipydll=False, **asm_args):
+        """Compile independent groups of your scripts into separate assemblies.
+
+        This method analyzes each script separately, and divides the scripts
+        into groups so that no script imports (directly or indirectly) a
+        script in another group. The directories of the scripts are
+        searched for modules in addition to ``dirs_of_modules``, so that a
+        script importing another script next to it is found. Then each
+        group is compiled into its own assembly by :meth:`create_asm` of a
+        new :class:`ModuleCompiler`, and pyc.py is run for the groups in
+        parallel. The assembly of a group is named after the first script
+        of the group, which is also the main file in creating .EXE files.
+
+        The scripts are analyzed in parallel using
+        :class:`multiprocessing.Pool`, so on Windows this method raises
+        :exc:`RuntimeError` unless the script calling it protects its main
+        code with ``if __name__ == "__main__":``.
+
+        :param str out_dir: (optional) Specify the directory where the
+                            assemblies should be created, or the current
+                            directory will be used.
+        :param list dirs_of_modules: (optional) The same as that of
+                                     :meth:`check_compilability`.
+        :param bool copy_ipydll: (optional) Specify whether to copy the
+                                 IronPython DLL files into ``out_dir``.
+        :param asm_args: (optional) The other parameters of
+                         :meth:`create_asm` except ``out`` and ``stream``.
+        :return: The :class:`ModuleCompiler` instances used for the groups,
+                 whose :attr:`output_asm` shows the assemblies created
+        :rtype: list
+        :raises ironpycompiler.exceptions.ModuleCompilationError: if no
+                                                                  script
+                                                                  is
+                                                                  given,
+                                                                  or if
+                                                                  two
+                                                                  groups
+                                                                  would
+                                                                  create
+                                                                  assemblies
+                                                                  with the
+                                                                  same name
+
+        .. versionadded:: 1.0.0
+
+        """
+
+        if not self.paths_to_scripts:
+            raise exceptions.ModuleCompilationError(
+                msg="No script is given to compile.")
+        if out_dir is None:
+            out_dir = os.getcwd()
+        if asm_args.get("target_asm") in ["exe", "winexe"]:
+            extension = ".exe"
+        else:
+            extension = ".dll"
+
+        compilers = self._create_group_compilers(dirs_of_modules)
+        _set_group_outputs(compilers, out_dir, extension)
+
+        # 各グループのpyc.pyを並列に実行する
+        def compile_group(mc):
+            mc.create_asm(out=mc.output_asm, **asm_args)
+        processes = min(len(compilers), multiprocessing.cpu_count())
+        pool = multiprocessing.pool.ThreadPool(processes)
+        try:
+            pool.map(compile_group, compilers)
+        finally:
+            pool.close()
+            pool.join()
+
+        if copy_ipydll:
+            gather_ipydll(dest_dir=os.path.abspath(out_dir),
+                          ipy_dir=self.ipy_dir)
+
+        return compilers
+
+    def _create_group_compilers(self, dirs_of_modules=None):
+        """Create a :class:`ModuleCompiler` for each group of the scripts.
+
+        The returned instances have already been analyzed. This method is
+        used by :meth:`create_asms`. It should not be used directly.
+
+        :param list dirs_of_modules: (optional) The same as that of
+                                     :meth:`check_compilability`.
+        :rtype: list
+
+        """
+
+        self._set_dirs_of_modules(dirs_of_modules)
+        # スクリプト同士のインポートを見つけるため、スクリプトのディレクトリも探す
+        dirs = list(self.dirs_of_modules)
+        for d in sorted(set(os.path.dirname(p)
+                            for p in self.paths_to_scripts)):
+            if d not in dirs:
+                dirs.append(d)
+        found = _analyze_each(self.paths_to_scripts, dirs)
+
+        compilers = []
+        for group in _group_scripts(self.paths_to_scripts, found):
+            mc = ModuleCompiler(paths_to_scripts=group, ipy_dir=self.ipy_dir,
+                                pyc_path=self.pyc_abspath)
+            mc.dirs_of_modules = dirs
+            (mc.builtin_modules, compilable_modules,
+             mc.uncompilable_modules) = _merge_results(
+                 [found[self.paths_to_scripts.index(p)] for p in group])
+            mc.compilable_modules = datatypes.PathSet(compilable_modules)
+            mc._analyzed = True
+            compilers.append(mc)
+        return compilers
+
+
+class _FastModuleFinder(modulefinder.ModuleFinder):
+
+    """ModuleFinder skipping the code objects that import nothing.
+
+    :meth:`modulefinder.ModuleFinder.scan_code` decodes every instruction
+    of every code object in pure Python. This class first checks whether
+    the bytecode can contain ``IMPORT_NAME`` at all, and only decodes the
+    code objects that can. The names assigned in the skipped code objects
+    are not recorded, so :meth:`any_missing_maybe` may be inaccurate. It
+    should not be used directly.
+
+    """
+
+    _IMPORT_NAME = chr(dis.opmap["IMPORT_NAME"])
+
+    def scan_code(self, co, m):
+        if self._IMPORT_NAME in co.co_code:
+            modulefinder.ModuleFinder.scan_code(self, co, m)
+        else:
+            for c in co.co_consts:
+                if isinstance(c, type(co)):
+                    self.scan_code(c, m)
+
+
+def _classify_modules(mf, scripts):
+    """Classify the modules found by a :class:`modulefinder.ModuleFinder`.
+
+    :param mf: The :class:`modulefinder.ModuleFinder` that has already run
+               the scripts.
+    :param list scripts: The absolute paths to the scripts, which are
+                         excluded from the compilable modules.
+    :return: A tuple containing the set of the names of built-in modules,
+             the dictionary mapping the case-normalized paths to compilable
+             modules to the paths themselves, the set of the names of
+             uncompilable modules, and the set of the paths to the scripts
+             found
+    :rtype: tuple
+
+    """
+
+    cwd = os.getcwd()
+    script_set = dict((os.path.normcase(p), p) for p in scripts)
+    found_scripts = set()
+    builtin_modules = set()
+    compilable_modules = dict()
+    uncompilable_modules = set(mf.badmodules.keys())
+
+    for name, module in mf.modules.iteritems():
+        path_to_module = module.__file__
+        if path_to_module is None:
+            builtin_modules.add(name)
+        elif path_to_module.endswith((".pyd", ".PYD")):
+            uncompilable_modules.add(name)
+        else:
+            if not os.path.isabs(path_to_module):
+                path_to_module = os.path.join(cwd, path_to_module)
+            path_to_module = os.path.normpath(path_to_module)
+            key = os.path.normcase(path_to_module)
+            if key in script_set:
+                found_scripts.add(script_set[key])
+            else:
+                compilable_modules[key] = path_to_module
+
+    return (builtin_modules, compilable_modules, uncompilable_modules,
+            found_scripts)
+
+
+def _analyze_one(script, dirs, scripts):
+    """Find the modules required by a script. It should not be used directly.
+
+    This function is defined at the module level so that it can be passed
+    to the worker processes of :meth:`ModuleCompiler.check_compilability`.
+
+    :param str script: The path to the script.
+    :param list dirs: The paths of the directories where the modules exist.
+    :param list scripts: The paths to all the scripts being analyzed.
+    :return: The same tuple as :func:`_classify_modules`.
+    :rtype: tuple
+
+    """
+
+    mf = _FastModuleFinder(path=dirs)
+    mf.run_script(script)
+    return _classify_modules(mf, scripts)
+
+
+def _analyze_all(scripts, dirs):
+    """Find the modules required by the scripts with one ModuleFinder.
+
+    Modules already found while running a script are not parsed again for
+    the following scripts. It should not be used directly.
+
+    :param list scripts: The paths to the scripts.
+    :param list dirs: The paths of the directories where the modules exist.
+    :return: The same tuple as :func:`_classify_modules`.
+    :rtype: tuple
+
+    """
+
+    mf = _FastModuleFinder(path=dirs)
+    for script in scripts:
+        mf.run_script(script)
+    return _classify_modules(mf, scripts)
+
+
+def _analyze_each(scripts, dirs):
+    """Analyze the scripts separately and in parallel.
+
+    Each script is analyzed by :func:`_analyze_one` in a process of
+    :class:`multiprocessing.Pool`. It should not be used directly.
+
+    :param list scripts: The paths to the scripts.
+    :param list dirs: The paths of the directories where the modules exist.
+    :return: The results of :func:`_analyze_one` in the order of the scripts
+    :rtype: list
+
+    """
+
+    analyze = functools.partial(_analyze_one, dirs=dirs, scripts=scripts)
+    if len(scripts) == 1:
+        return [analyze(scripts[0])]
+
+    pool = multiprocessing.Pool(min(len(scripts),
+                                    multiprocessing.cpu_count()))
+    try:
+        return pool.map(analyze, scripts)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def _merge_results(found):
+    """Merge the results of :func:`_classify_modules`.
+
+    :param list found: The results of :func:`_classify_modules`.
+    :return: A tuple containing the set of the names of built-in modules,
+             the set of the paths to compilable modules, and the set of the
+             names of uncompilable modules
+    :rtype: tuple
+
+    """
+
+    # 大文字と小文字だけが異なるパスは同じモジュールとみなす
+    builtin_modules = set()
+    compilable_modules = dict()
+    uncompilable_modules = set()
+    for (builtin, compilable, uncompilable, _) in found:
+        builtin_modules.update(builtin)
+        compilable_modules.update(compilable)
+        uncompilable_modules.update(uncompilable)
+    return (builtin_modules, set(compilable_modules.itervalues()),
+            uncompilable_modules)
+
+
+def _group_scripts(scripts, found):
+    """Divide the scripts into groups of the scripts importing one another.
+
+    :param list scripts: The paths to the scripts.
+    :param list found: The results of :func:`_analyze_one` for the scripts.
+    :return: The lists of the paths to the scripts in each group, keeping
+             the order of ``scripts``
+    :rtype: list
+
+    """
+
+    # スクリプト間のインポートを無向グラフとみなし、連結成分を求める
+    neighbours = dict((script, set()) for script in scripts)
+    for (script, result) in zip(scripts, found):
+        for other in result[3]:
+            if other != script:
+                neighbours[script].add(other)
+                neighbours[other].add(script)
+
+    groups = []
+    visited = set()
+    for script in scripts:
+        if script in visited:
+            continue
+        group = []
+        todo = [script]
+        visited.add(script)
+        while todo:
+            current = todo.pop()
+            group.append(current)
+            for other in neighbours[current] - visited:
+                visited.add(other)
+                todo.append(other)
+        groups.append(sorted(group, key=scripts.index))
+    return groups
+
+
+def _set_group_outputs(compilers, out_dir, extension):
+    """Set :attr:`ModuleCompiler.output_asm` of the compilers of the groups.
+
+    :param list compilers: The :class:`ModuleCompiler` instances of the
+                           groups.
+    :param str out_dir: The directory where the assemblies are created.
+    :param str extension: The extension of the assemblies.
+    :raises ironpycompiler.exceptions.ModuleCompilationError: if two
+                                                              groups would
+                                                              create
+                                                              assemblies
+                                                              with the same
+                                                              name
+
+    """
+
+    # 並列に実行する前に、出力ファイル名の衝突を確認する
+    outputs = dict()
+    for mc in compilers:
+        basename = os.path.splitext(os.path.basename(
+            mc.paths_to_scripts[0]))[0]
+        mc.output_asm = os.path.join(out_dir, basename + extension)
+        key = os.path.normcase(os.path.abspath(mc.output_asm))
+        if key in outputs:
+            raise exceptions.ModuleCompilationError(
+                msg="{0} and {1} would both be compiled into {2}.".format(
+                    outputs[key], mc.paths_to_scripts[0], mc.output_asm))
+        outputs[key] = mc.paths_to_scripts[0]
+
+
+def _stat_paths(paths):
+    """Get the modification times and sizes of the files or directories.
+
+    :param list paths: The paths to the files or directories.
+    :return: A dictionary mapping the paths to tuples of their modification
+             times and sizes, or to None if they do not exist
+    :rtype: dict
+
+    """
+
+    stamps = dict()
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except EnvironmentError:
+            stamps[path] = None
+        else:
+            stamps[path] = (st.st_mtime, st.st_size)
+    return stamps
+
+
+def _cache_path(ipy_dir, paths_to_scripts, dirs_of_modules,
+                share_modulefinder):
+    """Get the path to the cache file of an analysis.
+
+    :param str ipy_dir: The path to the IronPython directory.
+    :param list paths_to_scripts: The paths to the scripts analyzed.
+    :param list dirs_of_modules: The paths of the directories searched.
+    :param bool share_modulefinder: Whether the scripts were analyzed with
+                                    one :class:`modulefinder.ModuleFinder`.
+    :rtype: str
+
+    """
+
+    key = repr((__version__, ipy_dir, sorted(paths_to_scripts),
+                list(dirs_of_modules), bool(share_modulefinder)))
+    cache_dirname = constants.CACHE_DIRNAME
+    if hasattr(os, "getuid"):  # POSIXではユーザーごとに分ける
+        cache_dirname += "-{0}".format(os.getuid())
+    return os.path.join(tempfile.gettempdir(), cache_dirname,
+                        hashlib.sha1(key).hexdigest() + ".pkl")
+
+
+def _is_private_dir(path):
+    """Check that only the current user can modify the directory.
+
+    On Windows this function only checks that the directory exists, as the
+    temporary directory is private to each user there.
+
+    :param str path: The path to the directory.
+    :rtype: bool
+
+    """
+
+    try:
+        st = os.lstat(path)
+    except EnvironmentError:
+        return False
+    if not stat.S_ISDIR(st.st_mode):
+        return False
+    if hasattr(os, "getuid"):
+        return (st.st_uid == os.getuid() and
+                not st.st_mode & (stat.S_IWGRP | stat.S_IWOTH))
+    return True
+
+
+def _load_cache(cache_path):
+    """Load the cached results of an analysis if they are still valid.
+
+    The cache is ignored unless its directory is private to the current
+    user (see :func:`_is_private_dir`).
+
+    :param str cache_path: The path to the cache file.
+    :return: The results returned by :func:`_analyze_one` merged together,
+             or None if the cache is missing or out of date
+    :rtype: tuple
+
+    """
+
+    # 他のユーザーが置いたpickleを読み込まない
+    if not _is_private_dir(os.path.dirname(cache_path)):
+        return None
+
+    try:
+        with open(cache_path, "rb") as f:
+            (stamps, results) = pickle.load(f)
+    except Exception:  # キャッシュが無いか壊れている
+        return None
+
+    if _stat_paths(stamps.keys()) != stamps:
+        return None
+    return results
+
+
+def _save_cache(cache_path, watched, results):
+    """Save the results of an analysis. Failures are silently ignored.
+
+    Nothing is saved unless the cache directory is private to the current
+    user (see :func:`_is_private_dir`).
+
+    :param str cache_path: The path to the cache file.
+    :param list watched: The paths to the files or directories whose
+                         modification invalidates the cache.
+    :param tuple results: The results that should be cached.
+
+    """
+
+    try:
+        cache_dir = os.path.dirname(cache_path)
+        if not os.path.lexists(cache_dir):
+            os.makedirs(cache_dir, 0o700)
+        if not _is_private_dir(cache_dir):
+            return
+        with open(cache_path, "wb") as f:
+            pickle.dump((_stat_paths(watched), results), f,
+                        pickle.HIGHEST_PROTOCOL)
+    except EnvironmentError:
+        pass
+
 
 def gather_ipydll(dest_dir, ipy_dir=None):
     """ Copy the IronPython DLL files into the directory specified.
@@ -10,3 +10,6 @@ REGKEYS = ["SOFTWARE\\IronPython", "SOFTWARE\\Wow6432Node\\IronPython"]
 
 #: The default name of the IronPython executable.
 EXECUTABLE = "ipy.exe"
+
+#: The name of the directory where the results of analyses are cached.
+CACHE_DIRNAME = "ironpycompiler_cache"
@@ -5,8 +5,11 @@
 
 """
 
+import collections
 import distutils.version
+import os
 import platform
+import re
 
 
 class HashableVersion(distutils.version.StrictVersion):
@@ -20,6 +23,9 @@ class HashableVersion(distutils.version.StrictVersion):
     .. versionadded:: 1.0.0
     """
 
+    # StrictVersionと同じ形式
+    _version_re = re.compile(r"^(\d+)\.(\d+)(?:\.(\d+))?(?:([ab])(\d+))?$")
+
     def __init__(self, vstring=None):
         """Initalize the instance.
 
@@ -27,16 +33,38 @@ class HashableVersion(distutils.version.StrictVersion):
 
         if vstring is None:
             vstring = platform.python_version()
-        distutils.version.StrictVersion.__init__(self, vstring)
+        self.parse(vstring)
+
+    def parse(self, vstring):
+        """Parse a version number in the same way as StrictVersion.
+
+        This method sets :attr:`major`, :attr:`minor`, and :attr:`patch`
+        at the same time as the attributes of StrictVersion.
+
+        :param str vstring: String showing a Python version.
+        :raises ValueError: if ``vstring`` is not a valid version number
+
+        """
+
+        match = self._version_re.match(vstring)
+        if match is None:
+            raise ValueError("invalid version number '{}'".format(vstring))
+        (major, minor, patch, prerelease, prerelease_num) = match.groups()
 
         #: Integer showing the major version.
-        self.major = self.version[0]
+        self.major = int(major)
 
         #: Integer showing the minor version.
-        self.minor = self.version[1]
+        self.minor = int(minor)
 
         #: Integer showing the patch version.
-        self.patch = self.version[2]
+        self.patch = int(patch) if patch else 0
+
+        self.version = (self.major, self.minor, self.patch)
+        if prerelease:
+            self.prerelease = (prerelease, int(prerelease_num))
+        else:
+            self.prerelease = None
 
     def __hash__(self):
         """Method to make instances of this class hashable.
@@ -57,3 +85,173 @@ class HashableVersion(distutils.version.StrictVersion):
         """
 
         return "{}.{}".format(self.major, self.minor)
+
+
+class PathSet(collections.MutableSet):
+
+    """Set of paths storing each directory part only once.
+
+    Each path is split into the part up to the last separator, which is
+    shared by all the paths in the same directory, and the rest. They are
+    joined again only when the set is iterated. Many modules required by
+    a script are in the same directories (e.g. the IronPython standard
+    library), so this takes less memory than a set of full paths.
+
+    Besides the operators of :class:`collections.MutableSet`, this class
+    provides the methods of :class:`set` that return or update sets, such
+    as :meth:`update`, :meth:`union`, and :meth:`copy`.
+
+    :param iterable: (optional) The paths that should be added.
+
+    .. versionadded:: 1.0.0
+    """
+
+    def __init__(self, iterable=()):
+        """Initalize the instance.
+
+        """
+
+        self._suffixes = dict()  # ディレクトリ部分 -> それに続く部分の集合
+        self._len = 0
+        self.update(iterable)
+
+    @staticmethod
+    def _split(path):
+        """Split a path after its last separator.
+
+        """
+
+        idx = path.rfind(os.sep)
+        if os.altsep is not None:
+            idx = max(idx, path.rfind(os.altsep))
+        return (path[:idx + 1], path[idx + 1:])
+
+    def __contains__(self, path):
+        (prefix, suffix) = self._split(path)
+        return suffix in self._suffixes.get(prefix, ())
+
+    def __iter__(self):
+        for (prefix, suffixes) in self._suffixes.iteritems():
+            for suffix in suffixes:
+                yield prefix + suffix
+
+    def __len__(self):
+        return self._len
+
+    def __repr__(self):
+        return "{}({!r})".format(self.__class__.__name__, list(self))
+
+    def add(self, path):
+        """Add a path to the set.
+
+        """
+
+        (prefix, suffix) = self._split(path)
+        suffixes = self._suffixes.setdefault(prefix, set())
+        if suffix not in suffixes:
+            suffixes.add(suffix)
+            self._len += 1
+
+    def discard(self, path):
+        """Remove a path from the set if it is a member.
+
+        """
+
+        (prefix, suffix) = self._split(path)
+        suffixes = self._suffixes.get(prefix)
+        if suffixes is not None and suffix in suffixes:
+            suffixes.remove(suffix)
+            self._len -= 1
+            if not suffixes:  # 空になったディレクトリ部分は捨てる
+                del self._suffixes[prefix]
+
+    def clear(self):
+        """Remove all the paths from the set.
+
+        """
+
+        self._suffixes.clear()
+        self._len = 0
+
+    def copy(self):
+        """Return a shallow copy of the set.
+
+        """
+
+        return self.__class__(self)
+
+    def update(self, *others):
+        """Add all the paths in the iterables to the set.
+
+        """
+
+        for other in others:
+            for path in other:
+                self.add(path)
+
+    def difference_update(self, *others):
+        """Remove all the paths in the iterables from the set.
+
+        """
+
+        for other in others:
+            for path in other:
+                self.discard(path)
+
+    def intersection_update(self, *others):
+        """Keep only the paths found in all the iterables.
+
+        """
+
+        for other in others:
+            self &= set(other)
+
+    def union(self, *others):
+        """Return a new set with the paths in the set and the iterables.
+
+        """
+
+        result = self.copy()
+        result.update(*others)
+        return result
+
+    def difference(self, *others):
+        """Return a new set with the paths not in the iterables.
+
+        """
+
+        result = self.copy()
+        result.difference_update(*others)
+        return result
+
+    def intersection(self, *others):
+        """Return a new set with the paths found in all the iterables.
+
+        """
+
+        result = self.copy()
+        result.intersection_update(*others)
+        return result
+
+    def symmetric_difference(self, other):
+        """Return a new set with the paths in either the set or ``other``.
+
+        The paths in both are excluded.
+
+        """
+
+        return self ^ set(other)
+
+    def issubset(self, other):
+        """Check whether every path in the set is in ``other``.
+
+        """
+
+        return self <= set(other)
+
+    def issuperset(self, other):
+        """Check whether every path in ``other`` is in the set.
+
+        """
+
+        return all(path in self for path in other)
@@ -7,7 +7,9 @@
 
 import itertools
 import os
+import re
 import glob
+import fnmatch
 
 # Original modules
 from . import exceptions
@@ -15,6 +17,9 @@ from . import constants
 from . import datatypes
 from . import process
 
+# search_ipyの結果のキャッシュ
+_search_ipy_cache = dict()
+
 
 def search_ipy_reg(regkeys=None, executable=constants.EXECUTABLE,
                    detailed=False):
@@ -122,7 +127,8 @@ def search_ipy_env(executable=constants.EXECUTABLE, detailed=False):
     directories).
 
     :param str executable: (optional) The name of the IronPython
-                           executable.
+                           executable, which may contain shell-style
+                           wildcards.
     :param bool detailed: (optional) If this parameter is true, the key of the
                           dictionary will be an instance of
                           :class:`ironpycompiler.datatypes.HashableVersion`
@@ -141,20 +147,27 @@ def search_ipy_env(executable=constants.EXECUTABLE, detailed=False):
 
     """
 
-    ipydirpaths = []
+    ipy_exes = []
     foundipys = {}
 
+    # ワイルドカードを含むときだけパターンを（一度だけ）コンパイルする
+    if glob.has_magic(executable):
+        pattern = re.compile(fnmatch.translate(os.path.normcase(executable)))
+    else:
+        pattern = None
+
     for path in os.environ["PATH"].split(os.pathsep):
-        for match_path in glob.glob(os.path.join(path, executable)):
-            if os.access(match_path, os.X_OK):
-                ipydirpaths.append(os.path.dirname(match_path))
+        for ipy_exe in _find_executables(path, executable, pattern):
+            if ipy_exe not in ipy_exes:
+                ipy_exes.append(ipy_exe)
 
-    if len(ipydirpaths) == 0:
+    if len(ipy_exes) == 0:
         raise exceptions.IronPythonDetectionError(
             msg="Could not find any executable file named %s." % executable)
 
-    for directory in ipydirpaths:
-        ipy_exe = os.path.abspath(os.path.join(directory, executable))
+    for ipy_exe in ipy_exes:
+        directory = os.path.dirname(ipy_exe)
+        ipy_exe = os.path.abspath(ipy_exe)
         try:
             ipy_ver = validate_pythonexe(ipy_exe)
         except exceptions.IronPythonValidationError:
@@ -173,6 +186,36 @@ def search_ipy_env(executable=constants.EXECUTABLE, detailed=False):
         return foundipys
 
 
+def _find_executables(directory, executable, pattern=None):
+    """Find the executables in a directory. It should not be used directly.
+
+    :param str directory: The path to the directory.
+    :param str executable: The name of the executable.
+    :param pattern: (optional) The compiled regular expression made from
+                    ``executable`` if it contains wildcards.
+    :return: The paths to the executables found
+    :rtype: list
+
+    """
+
+    if pattern is None:
+        candidates = [os.path.join(directory, executable)]
+    else:
+        try:
+            names = os.listdir(directory or os.curdir)
+        except EnvironmentError:
+            return []
+        candidates = [os.path.join(directory, name) for name in names
+                      if pattern.match(os.path.normcase(name))]
+
+    # Windowsのos.accessはX_OKを確認しないので、isfileだけで十分
+    if os.name == "nt":
+        return [c for c in candidates if os.path.isfile(c)]
+    else:
+        return [c for c in candidates
+                if os.path.isfile(c) and os.access(c, os.X_OK)]
+
+
 def search_ipy(regkeys=None, executable=constants.EXECUTABLE, detailed=False):
     """Search for IronPython directories.
 
@@ -200,13 +243,18 @@ def search_ipy(regkeys=None, executable=constants.EXECUTABLE, detailed=False):
        was mutable.
 
     .. versionchanged:: 1.0.0
-       The parameter ``detailed`` was added.
+       The parameter ``detailed`` was added. The results are cached and
+       reused until :func:`clear_cache` is called.
 
     """
 
     if regkeys is None:
         regkeys = constants.REGKEYS
 
+    cache_key = (tuple(regkeys), executable, detailed)
+    if cache_key in _search_ipy_cache:
+        return dict(_search_ipy_cache[cache_key])
+
     try:
         foundipys = search_ipy_reg(regkeys, executable, detailed)
     except exceptions.IronPythonDetectionError:
@@ -225,7 +273,20 @@ def search_ipy(regkeys=None, executable=constants.EXECUTABLE, detailed=False):
         raise exceptions.IronPythonDetectionError(
             msg="Could not find any IronPython directory.")
     else:
-        return foundipys
+        _search_ipy_cache[cache_key] = foundipys
+        return dict(foundipys)
+
+
+def clear_cache():
+    """Clear the results cached by :func:`search_ipy`.
+
+    Call this function if IronPython has been installed or uninstalled
+    since :func:`search_ipy` (or :func:`auto_detect`) was called.
+
+    .. versionadded:: 1.0.0
+    """
+
+    _search_ipy_cache.clear()
 
 
 def auto_detect(detailed=False):
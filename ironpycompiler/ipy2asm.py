@@ -28,19 +28,32 @@ def _compiler(args):
     mc = compiler.ModuleCompiler(
         paths_to_scripts=args.script)
 
+    # 独立したスクリプトのグループごとにコンパイルする
+    if args.split:
+        print "Analyzing and compiling scripts...",
+        compilers = mc.create_asms(out_dir=args.out, target_asm=args.target,
+                                   target_platform=args.platform,
+                                   embed=args.embed,
+                                   standalone=args.standalone, mta=args.mta,
+                                   copy_ipydll=args.copyipydll)
+        print "Done. This is the output by pyc.py."
+        for group_mc in compilers:
+            print
+            print group_mc.output_asm + ":"
+            print group_mc.pyc_stdout
+        return
+
     print "Analyzing scripts...",
     mc.check_compilability()
     print "Done."
     print
 
-    print "Compiling scripts...",
+    print "Compiling scripts. This is the output by pyc.py:"
     mc.create_asm(out=args.out, target_asm=args.target,
                   target_platform=args.platform, embed=args.embed,
                   standalone=args.standalone, mta=args.mta,
-                  copy_ipydll=args.copyipydll)
-
-    print "Done. This is the output by pyc.py."
-    print mc.pyc_stdout
+                  copy_ipydll=args.copyipydll, stream=sys.stdout)
+    print "Done."
 
 
 def _analyzer(args):
@@ -52,20 +65,19 @@ def _analyzer(args):
         paths_to_scripts=args.script)
     mc.check_compilability()
     print "Searched for modules in these directories:"
-    for d in mc.dirs_of_modules:
-        print d
+    sys.stdout.write("".join(d + "\n" for d in mc.dirs_of_modules))
     print
     print "These modules are required and compilable:"
-    for mod in mc.compilable_modules:
-        print mod
+    sys.stdout.write("".join(mod + "\n" for mod in
+                             sorted(mc.compilable_modules)))
     print
     print "These modules are required but uncompilable:"
-    for mod in mc.uncompilable_modules:
-        print mod
+    sys.stdout.write("".join(mod + "\n" for mod in
+                             sorted(mc.uncompilable_modules)))
     print
     print "These modules are built in:"
-    for mod in mc.builtin_modules:
-        print mod
+    sys.stdout.write("".join(mod + "\n" for mod in
+                             sorted(mc.builtin_modules)))
 
 
 def main():
@@ -117,6 +129,11 @@ def main():
     parser_compile.add_argument("-c", "--copyipydll",
                                 action="store_true",
                                 help="Copy IronPython DLLs.")
+    parser_compile.add_argument("--split",
+                                action="store_true",
+                                help=("Compile independent groups of scripts "
+                                      "into separate assemblies in parallel "
+                                      "(--out is the output directory)."))
     parser_compile.set_defaults(func=_compiler)
 
     # サブコマンドanalyze
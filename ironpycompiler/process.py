@@ -9,7 +9,7 @@ import subprocess
 import os
 
 
-def execute_ipy(path_to_exe, arguments, cwd=None):
+def execute_ipy(path_to_exe, arguments, cwd=None, stream=None):
     """Executes the IronPython executable with the provided arguments.
 
     :param str path_to_exe: The path to the IronPython executable.
@@ -17,6 +17,9 @@ def execute_ipy(path_to_exe, arguments, cwd=None):
                            IronPython executable.
     :param str cwd: Specify the working directory, or :func:`os.getcwd` will
                     be used.
+    :param stream: (optional) Specify a file-like object (e.g.
+                   :data:`sys.stdout`) to which the output should be written
+                   line by line while the process is running.
     :return: A tuple containing a string showing stdout/stderr, and the
              return code
     :rtype: tuple
@@ -32,12 +35,28 @@ def execute_ipy(path_to_exe, arguments, cwd=None):
 
        * Generally this function should not be used directly unless you intend
          to modify or extend IronPyCompiler.
+
+    .. versionchanged:: 1.0.0
+       The parameter ``stream`` was added.
     """
 
+    # 1行ずつ読むときは、1バイトずつreadしないようにバッファリングする
     ipy_sp = subprocess.Popen(
         args=[os.path.basename(path_to_exe)] + arguments,
         executable=path_to_exe, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT, universal_newlines=True,
+        bufsize=(0 if stream is None else -1),
         cwd=(cwd if cwd is not None else os.getcwd()))
-    output = ipy_sp.communicate()
-    return (output[0], ipy_sp.returncode)
+    if stream is None:
+        output = ipy_sp.communicate()[0]
+    else:
+        ipy_sp.stdin.close()
+        lines = []
+        for line in iter(ipy_sp.stdout.readline, ""):
+            stream.write(line)
+            stream.flush()
+            lines.append(line)
+        ipy_sp.stdout.close()
+        ipy_sp.wait()
+        output = "".join(lines)
+    return (output, ipy_sp.returncode)
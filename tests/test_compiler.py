@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for :mod:`ironpycompiler.compiler`.
+
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+# Original modules
+from ironpycompiler import compiler
+from ironpycompiler import exceptions
+
+
+class CreateAsmsTestCase(unittest.TestCase):
+
+    """Tests for :meth:`ironpycompiler.compiler.ModuleCompiler.create_asms`.
+
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def write_script(self, relpath, content):
+        path = os.path.join(self.tmp_dir, relpath)
+        if not os.path.isdir(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+        with open(path, "w") as f:
+            f.write(content)
+        return path
+
+    def test_sibling_script_in_same_group(self):
+        main = self.write_script("main.py", "import helper\n")
+        helper = self.write_script("helper.py", "x = 1\n")
+        lonely = self.write_script("lonely.py", "y = 2\n")
+        mc = compiler.ModuleCompiler(paths_to_scripts=[main, helper, lonely],
+                                     ipy_dir=self.tmp_dir)
+        groups = [c.paths_to_scripts
+                  for c in mc._create_group_compilers()]
+        self.assertEqual(groups, [[main, helper], [lonely]])
+
+    def test_clashing_outputs(self):
+        first = self.write_script(os.path.join("src", "other.py"), "x = 1\n")
+        second = self.write_script(os.path.join("src2", "other.py"),
+                                   "y = 2\n")
+        mc = compiler.ModuleCompiler(paths_to_scripts=[first, second],
+                                     ipy_dir=self.tmp_dir)
+        self.assertRaises(exceptions.ModuleCompilationError, mc.create_asms,
+                          out_dir=self.tmp_dir)
+
+    def test_no_scripts(self):
+        mc = compiler.ModuleCompiler(paths_to_scripts=[],
+                                     ipy_dir=self.tmp_dir)
+        self.assertRaises(exceptions.ModuleCompilationError, mc.create_asms,
+                          out_dir=self.tmp_dir)
+
+
+class CacheTestCase(unittest.TestCase):
+
+    """Tests for the cache of
+    :meth:`ironpycompiler.compiler.ModuleCompiler.check_compilability`.
+
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.lib_dir = os.path.join(self.tmp_dir, "lib")
+        os.mkdir(self.lib_dir)
+        # 本物の一時ディレクトリにキャッシュを作らない
+        self.orig_tempdir = tempfile.tempdir
+        tempfile.tempdir = os.path.join(self.tmp_dir, "tmp")
+        os.mkdir(tempfile.tempdir)
+
+    def tearDown(self):
+        tempfile.tempdir = self.orig_tempdir
+        shutil.rmtree(self.tmp_dir)
+
+    def write_script(self, relpath, content):
+        path = os.path.join(self.tmp_dir, relpath)
+        if not os.path.isdir(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+        with open(path, "w") as f:
+            f.write(content)
+        return path
+
+    def touch_later(self, path):
+        # タイムスタンプの分解能に左右されないよう、更新時刻を進める
+        t = os.stat(path).st_mtime + 10
+        os.utime(path, (t, t))
+
+    def analyze(self, script):
+        mc = compiler.ModuleCompiler(paths_to_scripts=[script],
+                                     ipy_dir=self.tmp_dir)
+        mc.check_compilability(dirs_of_modules=[self.lib_dir])
+        return mc
+
+    def cache_path(self, script):
+        return compiler._cache_path(self.tmp_dir, [script], [self.lib_dir],
+                                    True)
+
+    def test_script_edit_invalidates_cache(self):
+        mod_a = self.write_script(os.path.join("lib", "a.py"), "x = 1\n")
+        mod_b = self.write_script(os.path.join("lib", "b.py"), "y = 2\n")
+        script = self.write_script("main.py", "import a\n")
+        self.assertEqual(sorted(self.analyze(script).compilable_modules),
+                         [mod_a])
+        self.assertIsNotNone(compiler._load_cache(self.cache_path(script)))
+
+        self.write_script("main.py", "import a\nimport b\n")
+        self.touch_later(script)
+        self.assertEqual(sorted(self.analyze(script).compilable_modules),
+                         [mod_a, mod_b])
+
+    def test_new_submodule_invalidates_cache(self):
+        init = self.write_script(os.path.join("lib", "pkg", "__init__.py"),
+                                 "")
+        script = self.write_script("main.py", "import pkg.sub\n")
+        self.assertEqual(sorted(self.analyze(script).compilable_modules),
+                         [init])
+
+        sub = self.write_script(os.path.join("lib", "pkg", "sub.py"),
+                                "z = 3\n")
+        self.touch_later(os.path.dirname(sub))
+        self.assertEqual(sorted(self.analyze(script).compilable_modules),
+                         [init, sub])
+
+    @unittest.skipUnless(hasattr(os, "getuid"), "requires POSIX")
+    def test_shared_cache_dir_is_ignored(self):
+        script = self.write_script("main.py", "x = 1\n")
+        cache_path = self.cache_path(script)
+        cache_dir = os.path.dirname(cache_path)
+        results = (set(["sys"]), set(), set())
+        os.mkdir(cache_dir, 0o700)
+        compiler._save_cache(cache_path, [script], results)
+        self.assertEqual(compiler._load_cache(cache_path), results)
+
+        # グループが書き込めるディレクトリは読み書きしない
+        os.remove(cache_path)
+        os.chmod(cache_dir, 0o770)
+        compiler._save_cache(cache_path, [script], results)
+        self.assertFalse(os.path.exists(cache_path))
+        os.chmod(cache_dir, 0o700)
+        compiler._save_cache(cache_path, [script], results)
+        os.chmod(cache_dir, 0o770)
+        self.assertIsNone(compiler._load_cache(cache_path))
+
+        # 他のユーザーのディレクトリも読み書きしない
+        os.chmod(cache_dir, 0o700)
+        orig_getuid = os.getuid
+        os.getuid = lambda: orig_getuid() + 1
+        try:
+            self.assertIsNone(compiler._load_cache(cache_path))
+            os.remove(cache_path)
+            compiler._save_cache(cache_path, [script], results)
+            self.assertFalse(os.path.exists(cache_path))
+        finally:
+            os.getuid = orig_getuid
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for :mod:`ironpycompiler.datatypes`.
+
+"""
+
+import os
+import unittest
+
+# Original modules
+from ironpycompiler import datatypes
+
+
+class PathSetTestCase(unittest.TestCase):
+
+    """Tests for :class:`ironpycompiler.datatypes.PathSet`.
+
+    """
+
+    def setUp(self):
+        self.paths = [os.path.join("lib", "a.py"), os.path.join("lib", "b.py"),
+                      os.path.join("pkg", "__init__.py")]
+
+    def test_set_methods(self):
+        ps = datatypes.PathSet(self.paths[:1])
+        ps.update(self.paths[1:])
+        self.assertEqual(ps, set(self.paths))
+        copied = ps.copy()
+        copied.discard(self.paths[0])
+        self.assertIn(self.paths[0], ps)
+        self.assertEqual(ps.union(["x.py"]), set(self.paths + ["x.py"]))
+        self.assertEqual(ps.difference(self.paths[:2]), set(self.paths[2:]))
+        self.assertTrue(ps.issubset(self.paths))
+
+    def test_discard_whole_directory(self):
+        ps = datatypes.PathSet(self.paths)
+        ps.discard(self.paths[2])
+        ps.discard(self.paths[2])
+        self.assertEqual(len(ps), 2)
+        self.assertNotIn(self.paths[2], ps)
+        self.assertEqual(sorted(ps), sorted(self.paths[:2]))
+
+        ps.discard(self.paths[0])
+        ps.discard(self.paths[1])
+        self.assertEqual(len(ps), 0)
+        self.assertEqual(list(ps), [])
+
+        ps.add(self.paths[2])
+        self.assertIn(self.paths[2], ps)
+        self.assertEqual(list(ps), [self.paths[2]])
+
+
+if __name__ == "__main__":
+    unittest.main()